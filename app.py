@@ -50,32 +50,26 @@ import asyncio
 import inspect
 import logging
 import streamlit as st
-from pathlib import Path
 from dotenv import load_dotenv
 
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_mcp_adapters.client import MultiServerMCPClient
 from langchain_core.messages import HumanMessage, AIMessage, ToolMessage, SystemMessage
 
-from config_loader import load_config, get_enabled_servers, validate_config
+from config_loader import build_config
+from logging_setup import setup_logging
+from tool_utils import ToolResultCache, dispatch_tool_calls, dumps
 
 # Load environment variables
 load_dotenv()
 
 # Setup logging
-log_dir = Path("logs")
-log_dir.mkdir(exist_ok=True)
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_dir / 'mcp_chat.log'),
-        logging.StreamHandler()
-    ]
-)
+setup_logging('mcp_chat.log')
 logger = logging.getLogger(__name__)
 
+# Configuration file
+CONFIG_PATH = "config.yaml"
+
 # System prompt
 SYSTEM_PROMPT = (
     "You have access to tools. When you choose to call a tool, do not narrate status updates. "
@@ -83,6 +77,60 @@ SYSTEM_PROMPT = (
 )
 
 
+@st.cache_resource(show_spinner=False)
+def get_llm(api_key: str, model: str, temperature: float) -> ChatGoogleGenerativeAI:
+    """
+    Create the Gemini chat model once per (api_key, model, temperature).
+    
+    Returns:
+        ChatGoogleGenerativeAI: Shared LLM instance
+    """
+    return ChatGoogleGenerativeAI(api_key=api_key, model=model, temperature=temperature)
+
+
+@st.cache_resource(show_spinner=False)
+def get_mcp_client(servers_key: str) -> MultiServerMCPClient:
+    """
+    Create the MCP client once per server configuration.
+    
+    Cached across Streamlit reruns and sessions so server connections are
+    not rebuilt on every interaction.
+    
+    Args:
+        servers_key: Enabled servers dictionary serialized as sorted JSON
+        
+    Returns:
+        MultiServerMCPClient: Shared client instance
+    """
+    return MultiServerMCPClient(json.loads(servers_key))
+
+
+@st.cache_resource(
+    show_spinner=False,
+    hash_funcs={MultiServerMCPClient: id, ChatGoogleGenerativeAI: id},
+)
+def get_tools_bundle(client: MultiServerMCPClient, llm: ChatGoogleGenerativeAI, _loop):
+    """
+    List MCP tools once and bind them to the LLM.
+    
+    Client and LLM are themselves cached singletons, so they are keyed by
+    identity instead of being hashed by value.
+    
+    Args:
+        client: Cached MCP client
+        llm: Cached LLM
+        _loop: Event loop used to run the tool listing (not hashed)
+        
+    Returns:
+        tuple: (tools, tool_by_name, is_coro, llm_with_tools), where is_coro
+        maps tool names to whether they are awaited natively
+    """
+    tools = _loop.run_until_complete(client.get_tools())
+    tool_by_name = {t.name: t for t in tools}
+    is_coro = {name: _is_async_tool(t) for name, t in tool_by_name.items()}
+    return tools, tool_by_name, is_coro, llm.bind_tools(tools)
+
+
 def initialize_app():
     """
     Initialize the Streamlit application with configuration, LLM, and MCP tools.
@@ -93,61 +141,60 @@ def initialize_app():
     try:
         logger.info("Starting application initialization")
         
-        # Load and validate configuration
-        config = load_config()
-        validate_config(config)
+        # Load and validate configuration (memoized until the file changes)
+        cfg = build_config(CONFIG_PATH)
         
         # Get app settings
-        app_config = config.get('app', {})
         st.set_page_config(
-            page_title=app_config.get('title', 'MCP Chat'),
-            page_icon=app_config.get('icon', '🧰'),
-            layout=app_config.get('layout', 'centered')
+            page_title=cfg.app_title,
+            page_icon=cfg.app_icon,
+            layout=cfg.app_layout
         )
         
         # Initialize LLM
-        llm_config = config.get('llm', {})
-        api_key = os.getenv(llm_config.get('api_key_env', 'GEMINI_API_KEY'))
+        api_key = os.getenv(cfg.api_key_env)
         
         if not api_key:
             st.error("❌ GEMINI_API_KEY not found in environment variables")
             logger.error("GEMINI_API_KEY not set")
             return False
         
-        st.session_state.llm = ChatGoogleGenerativeAI(
-            api_key=api_key,
-            model=llm_config.get('model', 'gemini-2.5-flash'),
-            temperature=llm_config.get('temperature', 0.5)
-        )
-        logger.info(f"LLM initialized: {llm_config.get('model')}")
+        st.session_state.llm = get_llm(api_key, cfg.llm_model, cfg.llm_temp)
+        logger.info(f"LLM initialized: {cfg.llm_model}")
         
         # Initialize MCP client with enabled servers
-        servers = get_enabled_servers(config)
+        servers = cfg.servers
         
         if not servers:
             st.error("❌ No enabled servers found in configuration")
             logger.error("No enabled servers configured")
             return False
         
+        # Persistent event loop for this session, reused across reruns
+        if "loop" not in st.session_state:
+            st.session_state.loop = asyncio.new_event_loop()
+        
         logger.info(f"Initializing MCP client with servers: {list(servers.keys())}")
-        st.session_state.client = MultiServerMCPClient(servers)
+        st.session_state.client = get_mcp_client(dumps(servers, sort_keys=True))
         
-        # Get tools from all servers
+        # Get tools from all servers and bind them to the LLM
         try:
-            tools = asyncio.run(st.session_state.client.get_tools())
-            st.session_state.tools = tools
-            st.session_state.tool_by_name = {t.name: t for t in tools}
-            logger.info(f"Loaded {len(tools)} tools from MCP servers")
+            (
+                st.session_state.tools,
+                st.session_state.tool_by_name,
+                st.session_state.is_coro,
+                st.session_state.llm_with_tools,
+            ) = get_tools_bundle(st.session_state.client, st.session_state.llm, st.session_state.loop)
+            logger.info(f"Loaded {len(st.session_state.tools)} tools from MCP servers")
         except Exception as e:
             st.error(f"❌ Failed to load tools from MCP servers: {str(e)}")
             logger.error(f"Failed to load tools: {e}", exc_info=True)
             return False
         
-        # Bind tools to LLM
-        st.session_state.llm_with_tools = st.session_state.llm.bind_tools(tools)
-        
-        # Initialize conversation history
+        # Initialize conversation history and per-session tool result cache
         st.session_state.history = [SystemMessage(content=SYSTEM_PROMPT)]
+        st.session_state.visible_msgs = []
+        st.session_state.tool_cache = ToolResultCache()
         st.session_state.initialized = True
         
         logger.info("Application initialization complete")
@@ -170,17 +217,50 @@ def initialize_app():
 
 
 def render_chat_history():
-    """Render chat history, skipping system and tool messages."""
-    for msg in st.session_state.history:
-        if isinstance(msg, HumanMessage):
-            with st.chat_message("user"):
-                st.markdown(msg.content)
-        elif isinstance(msg, AIMessage):
-            # Skip assistant messages that contain tool_calls
-            if getattr(msg, "tool_calls", None):
-                continue
-            with st.chat_message("assistant"):
-                st.markdown(msg.content)
+    """
+    Render chat history, skipping system and tool messages.
+    
+    Iterates the pre-filtered (role, content) pairs kept in
+    st.session_state.visible_msgs rather than re-filtering the full history
+    on every rerun.
+    """
+    for role, content in st.session_state.visible_msgs:
+        with st.chat_message(role):
+            st.markdown(content)
+
+
+def _is_async_tool(tool) -> bool:
+    """Return True if the tool exposes a native coroutine implementation."""
+    return getattr(tool, "coroutine", None) is not None or inspect.iscoroutinefunction(tool.invoke)
+
+
+async def _run_all(tool_calls) -> list:
+    """
+    Execute all tool calls concurrently through the session's tool cache.
+
+    Async tools are awaited directly, sync tools run in a worker thread so
+    they don't block the others.
+
+    Args:
+        tool_calls: Tool calls emitted by the LLM
+
+    Returns:
+        list: One ToolMessage per tool call, in the original order
+    """
+    is_coro = st.session_state.is_coro
+
+    def invoke(tool, args):
+        if is_coro[tool.name]:
+            return tool.ainvoke(args)
+        return asyncio.to_thread(tool.invoke, args)
+
+    contents = await dispatch_tool_calls(
+        tool_calls, st.session_state.tool_by_name, st.session_state.tool_cache, invoke
+    )
+    return [
+        ToolMessage(tool_call_id=tc["id"], content=content)
+        for tc, content in zip(tool_calls, contents)
+    ]
 
 
 def process_user_message(user_text: str):
@@ -192,73 +272,39 @@ def process_user_message(user_text: str):
     """
     try:
         logger.info(f"Processing user message: {user_text[:50]}...")
+        history = st.session_state.history
+        history_append = history.append
+        visible_append = st.session_state.visible_msgs.append
         
         # Add user message to history
-        st.session_state.history.append(HumanMessage(content=user_text))
+        history_append(HumanMessage(content=user_text))
+        visible_append(("user", user_text))
         
         # First pass: let the model decide whether to call tools
-        first = st.session_state.llm_with_tools.invoke(st.session_state.history)
+        first = st.session_state.llm_with_tools.invoke(history)
         tool_calls = getattr(first, "tool_calls", None)
         
         if not tool_calls:
             # No tools → show & store assistant reply
             with st.chat_message("assistant"):
                 st.markdown(first.content or "")
-            st.session_state.history.append(first)
+            history_append(first)
+            visible_append(("assistant", first.content or ""))
             logger.info("Response generated without tool calls")
         else:
             # Append assistant message WITH tool_calls (do NOT render)
-            st.session_state.history.append(first)
+            history_append(first)
             logger.info(f"Executing {len(tool_calls)} tool calls")
             
-            # Execute requested tools and append ToolMessages
-            tool_msgs = []
-            for tc in tool_calls:
-                try:
-                    name = tc["name"]
-                    args = tc.get("args") or {}
-                    
-                    if isinstance(args, str):
-                        try:
-                            args = json.loads(args)
-                        except json.JSONDecodeError:
-                            logger.warning(f"Failed to parse tool args as JSON: {args}")
-                    
-                    logger.info(f"Calling tool: {name} with args: {args}")
-                    tool = st.session_state.tool_by_name[name]
-                    
-                    # Handle both sync and async tools
-                    if inspect.iscoroutinefunction(tool.invoke):
-                        res = asyncio.run(tool.ainvoke(args))
-                    else:
-                        res = tool.invoke(args)
-                    
-                    tool_msgs.append(
-                        ToolMessage(tool_call_id=tc["id"], content=json.dumps(res))
-                    )
-                    logger.info(f"Tool {name} executed successfully")
-                    
-                except KeyError:
-                    error_msg = f"Tool '{name}' not found"
-                    logger.error(error_msg)
-                    tool_msgs.append(
-                        ToolMessage(tool_call_id=tc["id"], content=json.dumps({"error": error_msg}))
-                    )
-                
-                except Exception as e:
-                    error_msg = f"Error executing tool '{name}': {str(e)}"
-                    logger.error(error_msg, exc_info=True)
-                    tool_msgs.append(
-                        ToolMessage(tool_call_id=tc["id"], content=json.dumps({"error": error_msg}))
-                    )
-            
-            st.session_state.history.extend(tool_msgs)
+            # Execute requested tools concurrently and append ToolMessages
+            tool_msgs = st.session_state.loop.run_until_complete(_run_all(tool_calls))
+            history.extend(tool_msgs)
             
-            # Final assistant reply using tool outputs
-            final = st.session_state.llm.invoke(st.session_state.history)
+            # Final assistant reply using tool outputs, streamed as tokens arrive
             with st.chat_message("assistant"):
-                st.markdown(final.content or "")
-            st.session_state.history.append(AIMessage(content=final.content or ""))
+                content = st.write_stream(chunk.text for chunk in st.session_state.llm.stream(history))
+            history_append(AIMessage(content=content))
+            visible_append(("assistant", content))
             logger.info("Final response generated with tool results")
     
     except Exception as e:
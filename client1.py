@@ -18,7 +18,7 @@ Features:
 Architecture:
 -------------
 1. Loads configuration from config.yaml and environment variables
-2. Creates MCP client with configured servers
+2. Creates MCP client with configured servers (once per process, see mcp_pool)
 3. Retrieves available tools from all servers
 4. Binds tools to Gemini LLM
 5. Processes user prompt with tool invocation support
@@ -36,6 +36,7 @@ Usage:
 Or import and use programmatically:
     from client1 import main
     result = asyncio.run(main("your prompt here"))
+    results = asyncio.run(main_batch(["first prompt", "second prompt"]))
 
 Dependencies:
 -------------
@@ -48,36 +49,125 @@ Author: MCP Chat Team
 License: See LICENSE file
 """
 
-import os
-import json
+import re
 import asyncio
 import logging
-from pathlib import Path
 from dotenv import load_dotenv
 
-from langchain_mcp_adapters.client import MultiServerMCPClient
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain.messages import ToolMessage, HumanMessage
 
-from config_loader import load_config, get_enabled_servers, validate_config
+from mcp_pool import MCPPool
+from logging_setup import setup_logging
+from tool_utils import ToolResultCache, dispatch_tool_calls
 
 # Load environment variables
 load_dotenv()
 
 # Setup logging
-log_dir = Path("logs")
-log_dir.mkdir(exist_ok=True)
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_dir / 'mcp_cli.log'),
-        logging.StreamHandler()
-    ]
-)
+setup_logging('mcp_cli.log')
 logger = logging.getLogger(__name__)
 
+# Instructions prepended to batched prompts
+BATCH_PROMPT = "Answer each query. Return answers as '1: ...\\n2: ...'.\n"
+
+# Start of a numbered answer line in a batched response ("1: ...", "**1:** ...")
+_BATCH_ANSWER_RE = re.compile(r'^[ \t]*[*_]*(\d+)[*_]*:[*_]*(?=\s)', re.MULTILINE)
+
+# Tool results shared across main() calls in this process
+_tool_cache = ToolResultCache()
+
+
+async def _execute_tool_calls(tool_calls: list, named_tools: dict) -> list:
+    """
+    Execute tool calls concurrently through the process-wide tool cache.
+    
+    Args:
+        tool_calls: Tool calls from the LLM response
+        named_tools: Mapping of tool name to tool
+        
+    Returns:
+        list: ToolMessage per tool call, in the original order
+    """
+    contents = await dispatch_tool_calls(
+        tool_calls, named_tools, _tool_cache, lambda tool, args: tool.ainvoke(args)
+    )
+    return [
+        ToolMessage(content=content, tool_call_id=tool_call['id'])
+        for tool_call, content in zip(tool_calls, contents)
+    ]
+
+
+async def _run_prompt(prompt: str, named_tools: dict, llm_with_tools) -> str:
+    """
+    Send a prompt to the LLM, executing any requested tools before the final answer.
+    
+    Args:
+        prompt: Prompt text
+        named_tools: Mapping of tool name to tool
+        llm_with_tools: LLM with MCP tools bound
+        
+    Returns:
+        str: Final response content
+    """
+    # First invocation: let model decide whether to use tools
+    response = await llm_with_tools.ainvoke(prompt)
+    
+    # Check if model wants to use tools
+    if not getattr(response, 'tool_calls', None):
+        logger.info("Response generated without tool calls")
+        return response.content
+    
+    # Execute tool calls concurrently
+    logger.info(f"Executing {len(response.tool_calls)} tool calls")
+    tool_messages = await _execute_tool_calls(response.tool_calls, named_tools)
+    
+    # Build message history
+    messages = [HumanMessage(content=prompt), response] + tool_messages
+    
+    # Get final response from model
+    logger.info("Getting final response from LLM")
+    model_response = await llm_with_tools.ainvoke(messages)
+    
+    logger.info(f"Final response: {model_response.content[:100]}...")
+    return model_response.content
+
+
+def _split_batched_answers(text: str, count: int) -> list:
+    """
+    Split a numbered batch response ("1: ...\\n2: ...") into per-query answers.
+    
+    Answer markers are only accepted in order (1, 2, ... count), so numbered
+    lines inside an answer stay part of that answer.
+    
+    Args:
+        text: Batched LLM response
+        count: Number of queries in the batch
+        
+    Returns:
+        list: Answers in query order; answers that cannot be located are
+        filled with the full response text
+    """
+    bounds = []
+    for match in _BATCH_ANSWER_RE.finditer(text):
+        if len(bounds) == count:
+            break
+        if int(match.group(1)) == len(bounds) + 1:
+            bounds.append((match.start(), match.end()))
+    
+    answers = [
+        text[end:bounds[i + 1][0] if i + 1 < len(bounds) else len(text)].strip()
+        for i, (_, end) in enumerate(bounds)
+    ]
+    
+    if len(answers) < count:
+        logger.warning(
+            f"Batched response has {len(answers)} of {count} numbered answers; "
+            "using the full response for the rest"
+        )
+        answers.extend([text.strip()] * (count - len(answers)))
+    
+    return answers
+
 
 async def main(prompt: str) -> str:
     """
@@ -96,99 +186,56 @@ async def main(prompt: str) -> str:
     try:
         logger.info(f"Processing prompt: {prompt[:50]}...")
         
-        # Load and validate configuration
-        config = load_config()
-        validate_config(config)
-        
-        # Get enabled servers
-        servers = get_enabled_servers(config)
-        logger.info(f"Initializing MCP client with servers: {list(servers.keys())}")
-        
-        # Create MCP client
-        client = MultiServerMCPClient(servers)
+        pool = MCPPool.get_instance()
+        client, tools, named_tools, llm_with_tools = await pool.acquire()
+        return await _run_prompt(prompt, named_tools, llm_with_tools)
         
-        # Get tools from all servers
-        try:
-            tools = await client.get_tools()
-            logger.info(f"Loaded {len(tools)} tools from MCP servers")
-        except Exception as e:
-            logger.error(f"Failed to load tools: {e}", exc_info=True)
-            raise RuntimeError(f"Failed to load MCP tools: {str(e)}")
-        
-        # Create tool name mapping
-        named_tools = {tool.name: tool for tool in tools}
-        logger.info(f"Available tools: {list(named_tools.keys())}")
-        
-        # Initialize LLM
-        llm_config = config.get('llm', {})
-        api_key = os.getenv(llm_config.get('api_key_env', 'GEMINI_API_KEY'))
-        
-        if not api_key:
-            raise ValueError("GEMINI_API_KEY not found in environment variables")
-        
-        llm = ChatGoogleGenerativeAI(
-            model=llm_config.get('model', 'gemini-2.5-flash'),
-            api_key=api_key,
-            temperature=llm_config.get('temperature', 0.5)
-        )
-        logger.info(f"LLM initialized: {llm_config.get('model')}")
-        
-        # Bind tools to LLM
-        llm_with_tools = llm.bind_tools(tools=tools)
-        
-        # First invocation: let model decide whether to use tools
-        response = await llm_with_tools.ainvoke(prompt)
-        
-        # Check if model wants to use tools
-        if not getattr(response, 'tool_calls', None):
-            logger.info("Response generated without tool calls")
-            return response.content
+    except FileNotFoundError as e:
+        logger.error(f"Configuration file not found: {e}")
+        raise
+    
+    except ValueError as e:
+        logger.error(f"Configuration error: {e}")
+        raise
+    
+    except Exception as e:
+        logger.error(f"Unexpected error: {e}", exc_info=True)
+        raise
+
+
+async def main_batch(prompts: list[str]) -> list[str]:
+    """
+    Answer several independent prompts with a single LLM round trip.
+    
+    The prompts are numbered and sent together so the fixed system/tool
+    prompt cost is paid once per batch; the numbered reply is split back
+    into one answer per prompt.
+    
+    Args:
+        prompts: User prompts
         
-        # Execute tool calls
-        logger.info(f"Executing {len(response.tool_calls)} tool calls")
-        tool_messages = []
+    Returns:
+        list[str]: One answer per prompt, in order
         
-        for tool_call in response.tool_calls:
-            try:
-                tool_name = tool_call['name']
-                tool_args = tool_call['args'] or {}
-                tool_id = tool_call['id']
-                
-                logger.info(f"Calling tool: {tool_name} with args: {tool_args}")
-                
-                # Execute the tool
-                if tool_name not in named_tools:
-                    error_msg = f"Tool '{tool_name}' not found"
-                    logger.error(error_msg)
-                    tool_messages.append(
-                        ToolMessage(content=json.dumps({"error": error_msg}), tool_call_id=tool_id)
-                    )
-                    continue
-                
-                tool_response = await named_tools[tool_name].ainvoke(tool_args)
-                logger.info(f"Tool {tool_name} executed successfully")
-                
-                # Create the tool message
-                tool_messages.append(
-                    ToolMessage(content=json.dumps(tool_response), tool_call_id=tool_id)
-                )
-                
-            except Exception as e:
-                error_msg = f"Error executing tool '{tool_name}': {str(e)}"
-                logger.error(error_msg, exc_info=True)
-                tool_messages.append(
-                    ToolMessage(content=json.dumps({"error": error_msg}), tool_call_id=tool_id)
-                )
+    Raises:
+        ValueError: If configuration is invalid
+        Exception: For other errors during processing
+    """
+    if not prompts:
+        return []
+    if len(prompts) == 1:
+        return [await main(prompts[0])]
+    
+    try:
+        logger.info(f"Processing batch of {len(prompts)} prompts")
         
-        # Build message history
-        messages = [HumanMessage(content=prompt), response] + tool_messages
+        pool = MCPPool.get_instance()
+        client, tools, named_tools, llm_with_tools = await pool.acquire()
         
-        # Get final response from model
-        logger.info("Getting final response from LLM")
-        model_response = await llm_with_tools.ainvoke(messages)
+        batched = BATCH_PROMPT + "\n".join(f"{i + 1}: {p}" for i, p in enumerate(prompts))
+        content = await _run_prompt(batched, named_tools, llm_with_tools)
         
-        logger.info(f"Final response: {model_response.content[:100]}...")
-        return model_response.content
+        return _split_batched_answers(content, len(prompts))
         
     except FileNotFoundError as e:
         logger.error(f"Configuration file not found: {e}")
@@ -7,20 +7,43 @@ Environment variables take precedence over config file values.
 """
 
 import os
+import copy
 import yaml
 import logging
+import functools
+from collections import deque
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, NamedTuple, Optional
 import re
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader
+
 logger = logging.getLogger(__name__)
 
+_env_get = os.environ.get
+
+# Pattern: ${VAR_NAME:-default_value} or ${VAR_NAME}
+_ENV_RE = re.compile(r'\$\{([^}:]+)(?::-(.*?))?\}')
+
+
+def _replace_env(match: "re.Match[str]") -> str:
+    """Substitute a single ${VAR_NAME:-default} match from the environment."""
+    var_name = match.group(1)
+    default_value = match.group(2) if match.group(2) is not None else ''
+    return _env_get(var_name, default_value)
+
 
 def expand_env_vars(value: Any) -> Any:
     """
-    Recursively expand environment variables in configuration values.
+    Expand environment variables in configuration values.
     Supports ${VAR_NAME:-default_value} syntax.
     
+    Nested dicts and lists are walked iteratively with an explicit stack
+    and their string values are replaced in place.
+    
     Args:
         value: Configuration value (can be str, dict, list, etc.)
         
@@ -28,29 +51,64 @@ def expand_env_vars(value: Any) -> Any:
         Value with environment variables expanded
     """
     if isinstance(value, str):
-        # Pattern: ${VAR_NAME:-default_value} or ${VAR_NAME}
-        pattern = r'\$\{([^}:]+)(?::-(.*?))?\}'
-        
-        def replace_env(match):
-            var_name = match.group(1)
-            default_value = match.group(2) if match.group(2) is not None else ''
-            return os.getenv(var_name, default_value)
+        # Most values contain no placeholder; skip the regex engine entirely
+        if '${' not in value:
+            return value
         
-        return re.sub(pattern, replace_env, value)
+        return _ENV_RE.sub(_replace_env, value)
     
-    elif isinstance(value, dict):
-        return {k: expand_env_vars(v) for k, v in value.items()}
+    stack = deque([value])
+    pop, push = stack.pop, stack.append
     
-    elif isinstance(value, list):
-        return [expand_env_vars(item) for item in value]
+    while stack:
+        node = pop()
+        if isinstance(node, dict):
+            items = node.items()
+        elif isinstance(node, list):
+            items = enumerate(node)
+        else:
+            continue
+        
+        for key, item in items:
+            if isinstance(item, str):
+                if '${' in item:
+                    node[key] = _ENV_RE.sub(_replace_env, item)
+            elif isinstance(item, (dict, list)):
+                push(item)
     
     return value
 
 
+@functools.lru_cache(maxsize=8)
+def _load_cached(config_path: str, mtime: float) -> Dict[str, Any]:
+    """
+    Read, parse and expand a configuration file.
+    
+    Memoized on (path, mtime) so repeated loads of an unchanged file skip
+    the disk read and YAML parse; editing the file invalidates the entry.
+    """
+    try:
+        with open(config_path, 'r') as f:
+            config = yaml.load(f, Loader=_Loader)
+        
+        # Expand environment variables
+        config = expand_env_vars(config)
+        
+        logger.info(f"Configuration loaded from {config_path}")
+        return config
+    
+    except yaml.YAMLError as e:
+        logger.error(f"Error parsing configuration file: {e}")
+        raise
+
+
 def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
     """
     Load configuration from YAML file and expand environment variables.
     
+    Parsed results are cached per file modification time; each call returns
+    an independent copy so callers may mutate it freely.
+    
     Args:
         config_path: Path to configuration file
         
@@ -67,19 +125,8 @@ def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
         logger.error(f"Configuration file not found: {config_path}")
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
     
-    try:
-        with open(config_file, 'r') as f:
-            config = yaml.safe_load(f)
-        
-        # Expand environment variables
-        config = expand_env_vars(config)
-        
-        logger.info(f"Configuration loaded from {config_path}")
-        return config
-    
-    except yaml.YAMLError as e:
-        logger.error(f"Error parsing configuration file: {e}")
-        raise
+    config = _load_cached(str(config_file), os.path.getmtime(config_file))
+    return copy.deepcopy(config)
 
 
 def get_enabled_servers(config: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
@@ -127,3 +174,58 @@ def validate_config(config: Dict[str, Any]) -> bool:
     
     logger.info("Configuration validation passed")
     return True
+
+
+class AppConfig(NamedTuple):
+    """Validated configuration with defaults applied, for attribute access."""
+    
+    llm_model: str
+    llm_temp: float
+    api_key_env: str
+    servers: Dict[str, Dict[str, Any]]
+    app_title: str
+    app_icon: str
+    app_layout: str
+
+
+@functools.lru_cache(maxsize=1)
+def _build_cached(config_path: str, mtime: Optional[float]) -> AppConfig:
+    """Load and validate a configuration file; memoized on (path, mtime)."""
+    config = load_config(config_path)
+    validate_config(config)
+    
+    llm_config = config.get('llm', {})
+    app_config = config.get('app', {})
+    
+    return AppConfig(
+        llm_model=llm_config.get('model', 'gemini-2.5-flash'),
+        llm_temp=llm_config.get('temperature', 0.5),
+        api_key_env=llm_config.get('api_key_env', 'GEMINI_API_KEY'),
+        servers=get_enabled_servers(config),
+        app_title=app_config.get('title', 'MCP Chat'),
+        app_icon=app_config.get('icon', '🧰'),
+        app_layout=app_config.get('layout', 'centered'),
+    )
+
+
+def build_config(config_path: str = "config.yaml") -> AppConfig:
+    """
+    Load and validate configuration once, returning an AppConfig.
+    
+    The result is memoized until the file changes, so repeated calls skip
+    both parsing and validation. Each call gets its own copy of the servers
+    dict, so callers cannot alter the memoized configuration.
+    
+    Args:
+        config_path: Path to configuration file
+        
+    Returns:
+        AppConfig with defaults applied and only enabled servers
+        
+    Raises:
+        FileNotFoundError: If config file doesn't exist
+        ValueError: If configuration is invalid
+    """
+    mtime = os.path.getmtime(config_path) if os.path.exists(config_path) else None
+    cfg = _build_cached(config_path, mtime)
+    return cfg._replace(servers=copy.deepcopy(cfg.servers))
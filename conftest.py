@@ -0,0 +1,16 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def server_mod():
+    """
+    Import the math server module once per test session.
+    
+    pytest puts this conftest's directory on sys.path, so no path setup is needed.
+    """
+    import server
+    return server
@@ -0,0 +1,51 @@
+"""
+Logging Setup
+=============
+
+Configures application logging for the Streamlit and CLI clients.
+
+Records are queued by the caller and written by a background listener
+thread, keeping file/console I/O off the request path.
+"""
+
+import queue
+import atexit
+import logging
+import logging.handlers
+from pathlib import Path
+
+LOG_DIR = Path("logs")
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+def setup_logging(log_file: str, level: int = logging.INFO) -> None:
+    """
+    Route root logging through a QueueHandler to file and console handlers.
+
+    Does nothing if the root logger already has handlers, so it is safe to
+    call repeatedly (e.g. when Streamlit re-executes the app module).
+
+    Args:
+        log_file: Log file name, created under the logs/ directory
+        level: Root logger level
+    """
+    if logging.root.handlers:
+        return
+
+    LOG_DIR.mkdir(exist_ok=True)
+
+    log_formatter = logging.Formatter(LOG_FORMAT)
+    log_handlers = [
+        logging.FileHandler(LOG_DIR / log_file),
+        logging.StreamHandler()
+    ]
+    for handler in log_handlers:
+        handler.setFormatter(log_formatter)
+
+    log_queue = queue.Queue(-1)
+    logging.root.setLevel(level)
+    logging.root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    log_listener = logging.handlers.QueueListener(log_queue, *log_handlers, respect_handler_level=True)
+    log_listener.start()
+    atexit.register(log_listener.stop)
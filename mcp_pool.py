@@ -0,0 +1,149 @@
+"""
+MCP Connection Pool
+===================
+
+Process-wide holder for the MCP client, the tools it exposes and the
+Gemini LLM with those tools bound.
+
+Listing tools launches every configured stdio server once, so doing it on
+each call dominates repeated programmatic use (e.g. calling client1.main()
+several times from a notebook). MCPPool lists tools once per process and
+builds the tool-bound LLM once per event loop.
+
+What is reused:
+---------------
+- The MCP client and its tool list: shared by every caller in the process.
+- The tool-bound LLM: shared by callers on the same event loop. Its async
+  HTTP client belongs to the loop it first connected on, so each loop
+  (e.g. each asyncio.run() call) gets its own.
+
+Server subprocesses are not kept alive: langchain-mcp-adapters opens a new
+session for every tool call, so each call still starts its stdio server.
+
+Usage:
+------
+    pool = MCPPool.get_instance()
+    client, tools, named_tools, llm_with_tools = await pool.acquire()
+"""
+
+import os
+import asyncio
+import logging
+import threading
+import weakref
+from typing import Optional
+
+from langchain_mcp_adapters.client import MultiServerMCPClient
+from langchain_google_genai import ChatGoogleGenerativeAI
+
+from config_loader import build_config
+
+logger = logging.getLogger(__name__)
+
+
+class MCPPool:
+    """Lazily built, shared MCP client / tools / LLM bundle."""
+
+    _instance: Optional["MCPPool"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tools_bundle: Optional[tuple] = None
+        # event loop -> {"lock": asyncio.Lock, "llm_with_tools": ...}
+        self._loop_state = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def get_instance(cls) -> "MCPPool":
+        """Return the process-wide pool, creating it on first use."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    async def acquire(self) -> tuple:
+        """
+        Return the shared MCP resources, building them on first call.
+
+        Concurrent callers on the same loop wait for a single build instead
+        of each starting the servers.
+
+        Returns:
+            tuple: (client, tools, named_tools, llm_with_tools)
+
+        Raises:
+            ValueError: If configuration is invalid
+            RuntimeError: If tools cannot be loaded from the MCP servers
+        """
+        state = self._state_for(asyncio.get_running_loop())
+
+        async with state["lock"]:
+            if self._tools_bundle is None:
+                bundle = await self._load_tools()
+                with self._lock:
+                    if self._tools_bundle is None:
+                        self._tools_bundle = bundle
+
+            client, tools, named_tools = self._tools_bundle
+            if state["llm_with_tools"] is None:
+                state["llm_with_tools"] = self._bind_llm(tools)
+
+        return client, tools, named_tools, state["llm_with_tools"]
+
+    def reset(self) -> None:
+        """Drop the cached resources so the next acquire() rebuilds them."""
+        with self._lock:
+            self._tools_bundle = None
+            self._loop_state.clear()
+
+    def _state_for(self, loop: asyncio.AbstractEventLoop) -> dict:
+        """Return the per-loop lock and LLM slot, creating them on first use."""
+        with self._lock:
+            state = self._loop_state.get(loop)
+            if state is None:
+                state = {"lock": asyncio.Lock(), "llm_with_tools": None}
+                self._loop_state[loop] = state
+            return state
+
+    async def _load_tools(self) -> tuple:
+        """Load configuration, create the MCP client and list its tools."""
+        # Load and validate configuration
+        cfg = build_config()
+        servers = cfg.servers
+        logger.info(f"Initializing MCP client with servers: {list(servers.keys())}")
+
+        # Create MCP client
+        client = MultiServerMCPClient(servers)
+
+        # Get tools from all servers
+        try:
+            tools = await client.get_tools()
+            logger.info(f"Loaded {len(tools)} tools from MCP servers")
+        except Exception as e:
+            logger.error(f"Failed to load tools: {e}", exc_info=True)
+            raise RuntimeError(f"Failed to load MCP tools: {str(e)}")
+
+        # Create tool name mapping
+        named_tools = {tool.name: tool for tool in tools}
+        logger.info(f"Available tools: {list(named_tools.keys())}")
+
+        return client, tools, named_tools
+
+    def _bind_llm(self, tools: list):
+        """Create the Gemini LLM for the current loop and bind the MCP tools to it."""
+        cfg = build_config()
+        api_key = os.getenv(cfg.api_key_env)
+
+        if not api_key:
+            raise ValueError("GEMINI_API_KEY not found in environment variables")
+
+        llm = ChatGoogleGenerativeAI(
+            model=cfg.llm_model,
+            api_key=api_key,
+            temperature=cfg.llm_temp
+        )
+        logger.info(f"LLM initialized: {cfg.llm_model}")
+
+        # Bind tools to LLM
+        return llm.bind_tools(tools=tools)
@@ -10,6 +10,7 @@ Features:
 - Addition, subtraction, multiplication, division
 - Power and modulus operations
 - Robust type conversion and error handling
+- Tools annotated as read-only so clients can cache their results
 - FastMCP-based implementation with stdio transport
 
 Tools Provided:
@@ -45,24 +46,12 @@ from fastmcp import FastMCP
 
 mcp = FastMCP('maths')
 
-def _as_number(x):
-    """
-    Converts the input to a float if possible.
-    Handles strings with whitespace and numeric types.
-    Returns None if conversion fails.
-    """
-    try:
-        if isinstance(x, str):
-            return float(x.strip())
-        if isinstance(x, (int, float)):
-            return float(x)
-    except Exception as e:
-        print(e)
-        return None
-
-
-@mcp.tool()
-async def add(a: float, b: float) -> float:
+# Pure functions: clients may cache results for identical arguments
+PURE = {"readOnlyHint": True, "openWorldHint": False}
+
+
+@mcp.tool(annotations=PURE)
+def add(a: float, b: float) -> float:
     """
     Adds two numbers and returns the result.
 
@@ -73,11 +62,13 @@ async def add(a: float, b: float) -> float:
     Returns:
         float: Sum of a and b.
     """
-    return _as_number(a) + _as_number(b)
+    if type(a) is str: a = float(a)
+    if type(b) is str: b = float(b)
+    return a + b
 
 
-@mcp.tool()
-async def subtract(a: float, b: float) -> float:
+@mcp.tool(annotations=PURE)
+def subtract(a: float, b: float) -> float:
     """
     Subtracts the second number from the first and returns the result.
 
@@ -88,11 +79,13 @@ async def subtract(a: float, b: float) -> float:
     Returns:
         float: Difference of a and b.
     """
-    return _as_number(a) - _as_number(b)
+    if type(a) is str: a = float(a)
+    if type(b) is str: b = float(b)
+    return a - b
 
 
-@mcp.tool()
-async def multiply(a: float, b: float) -> float:
+@mcp.tool(annotations=PURE)
+def multiply(a: float, b: float) -> float:
     """
     Multiplies two numbers and returns the result.
 
@@ -103,11 +96,13 @@ async def multiply(a: float, b: float) -> float:
     Returns:
         float: Product of a and b.
     """
-    return _as_number(a) * _as_number(b)
+    if type(a) is str: a = float(a)
+    if type(b) is str: b = float(b)
+    return a * b
 
 
-@mcp.tool()
-async def divide(a: float, b: float) -> float:
+@mcp.tool(annotations=PURE)
+def divide(a: float, b: float) -> float:
     """
     Divides the first number by the second and returns the result.
 
@@ -118,19 +113,20 @@ async def divide(a: float, b: float) -> float:
     Returns:
         float: Result of division. Returns float('inf') if denominator is zero.
     """
-    denominator = _as_number(b)
-    if denominator == 0:
-        return float('inf')  # Handle division by zero
-    return _as_number(a) / denominator
+    if type(a) is str: a = float(a)
+    if type(b) is str: b = float(b)
+    return a / b if b else float('inf')  # Handle division by zero
 
 
-@mcp.tool()
-async def power(a: float,b: float) -> float:
+@mcp.tool(annotations=PURE)
+def power(a: float,b: float) -> float:
+    if type(a) is str: a = float(a)
+    if type(b) is str: b = float(b)
     return a**b
 
 
-@mcp.tool()
-async def modulus(a: float, b: float) -> float:
+@mcp.tool(annotations=PURE)
+def modulus(a: float, b: float) -> float:
     """
     Returns the modulus (remainder) of the division of the first number by the second.
 
@@ -141,7 +137,9 @@ async def modulus(a: float, b: float) -> float:
     Returns:
         float: Remainder after division.
     """
-    return _as_number(a) % _as_number(b)
+    if type(a) is str: a = float(a)
+    if type(b) is str: b = float(b)
+    return a % b
 
 if __name__ == "__main__":
     mcp.run(transport='stdio')
\ No newline at end of file
@@ -0,0 +1,39 @@
+"""
+Unit Tests for the CLI Client
+=============================
+
+Tests the helpers used by client1 that do not need an LLM or MCP server.
+"""
+
+import logging
+
+import pytest
+
+from client1 import _split_batched_answers
+
+
+# Batched LLM responses: (text, count, expected answers)
+@pytest.mark.parametrize("text,count,expected", [
+    ("1: 4\n2: 9", 2, ["4", "9"]),
+    ("Here you go:\n1: 4\n\n2: 9\n", 2, ["4", "9"]),
+    ("**1:** 4\n**2:** 9", 2, ["4", "9"]),
+    ("1: Paris\n2: Steps:\n1: boil water\n2: add tea", 2,
+     ["Paris", "Steps:\n1: boil water\n2: add tea"]),
+    ("1: a\n2: b\n3: c", 2, ["a", "b\n3: c"]),
+])
+def test_split_batched_answers(text, count, expected):
+    assert _split_batched_answers(text, count) == expected
+
+
+def test_split_batched_answers_missing(caplog):
+    with caplog.at_level(logging.WARNING, logger="client1"):
+        answers = _split_batched_answers("1: 4\nand the other is 9", 2)
+    assert answers == ["4\nand the other is 9", "1: 4\nand the other is 9"]
+    assert "1 of 2" in caplog.text
+
+
+def test_split_batched_answers_unnumbered(caplog):
+    with caplog.at_level(logging.WARNING, logger="client1"):
+        answers = _split_batched_answers("4 and 9", 2)
+    assert answers == ["4 and 9", "4 and 9"]
+    assert "0 of 2" in caplog.text
@@ -0,0 +1,98 @@
+"""
+Unit Tests for Configuration Loader
+===================================
+
+Tests configuration loading, caching and environment variable expansion.
+"""
+
+import os
+
+import pytest
+
+import config_loader
+from config_loader import build_config, expand_env_vars, get_enabled_servers, load_config
+
+CONFIG = """\
+llm:
+  model: gemini-2.5-flash
+servers:
+  math:
+    command: python
+    enabled: true
+"""
+
+
+# String values: (value, expanded)
+@pytest.mark.parametrize("value,expected", [
+    ("plain", "plain"),
+    ("${MCP_TEST_VAR}", "set"),
+    ("x-${MCP_TEST_VAR:-fallback}-y", "x-set-y"),
+    ("${MCP_TEST_UNSET:-fallback}", "fallback"),
+    ("${MCP_TEST_UNSET}", ""),
+])
+def test_expand_env_vars_str(monkeypatch, value, expected):
+    monkeypatch.setenv("MCP_TEST_VAR", "set")
+    monkeypatch.delenv("MCP_TEST_UNSET", raising=False)
+    assert expand_env_vars(value) == expected
+
+
+def test_expand_env_vars_nested_in_place(monkeypatch):
+    monkeypatch.setenv("MCP_TEST_VAR", "set")
+    monkeypatch.delenv("MCP_TEST_UNSET", raising=False)
+    inner = ["${MCP_TEST_VAR}", {"k": "${MCP_TEST_UNSET:-d}"}, 3]
+    config = {"a": {"b": inner}, "c": "plain", "d": None}
+    assert expand_env_vars(config) is config
+    assert config == {"a": {"b": ["set", {"k": "d"}, 3]}, "c": "plain", "d": None}
+    assert config["a"]["b"] is inner
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text(CONFIG)
+    config_loader._load_cached.cache_clear()
+    return path
+
+
+def test_load_config_returns_copy(config_file):
+    first = load_config(str(config_file))
+    get_enabled_servers(first)  # pops 'enabled' from the server configs
+    first["llm"]["model"] = "changed"
+    second = load_config(str(config_file))
+    assert second["llm"]["model"] == "gemini-2.5-flash"
+    assert second["servers"]["math"]["enabled"] is True
+
+
+def test_load_config_cached_until_mtime_changes(config_file):
+    load_config(str(config_file))
+    load_config(str(config_file))
+    assert config_loader._load_cached.cache_info().misses == 1
+
+    config_file.write_text(CONFIG.replace("gemini-2.5-flash", "gemini-2.5-pro"))
+    mtime = os.path.getmtime(config_file) + 10
+    os.utime(config_file, (mtime, mtime))
+    assert load_config(str(config_file))["llm"]["model"] == "gemini-2.5-pro"
+    assert config_loader._load_cached.cache_info().misses == 2
+
+
+def test_load_config_missing(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_config(str(tmp_path / "missing.yaml"))
+
+
+def test_build_config_memoized(config_file, monkeypatch):
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    config_loader._build_cached.cache_clear()
+    first = build_config(str(config_file))
+    first.servers["math"]["command"] = "changed"
+    second = build_config(str(config_file))
+    assert config_loader._build_cached.cache_info().misses == 1
+    assert second.llm_model == "gemini-2.5-flash"
+    assert second.servers == {"math": {"command": "python"}}
+
+
+def test_build_config_requires_api_key(config_file, monkeypatch):
+    monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+    config_loader._build_cached.cache_clear()
+    with pytest.raises(ValueError):
+        build_config(str(config_file))
@@ -0,0 +1,104 @@
+"""
+Unit Tests for Tool Dispatch Utilities
+======================================
+
+Tests the tool result cache and concurrent tool dispatch.
+"""
+
+import asyncio
+
+import pytest
+
+from tool_utils import ToolResultCache, cache_key, dispatch_tool_calls, dumps, is_cacheable, loads
+
+
+class FakeTool:
+    """Minimal stand-in for a LangChain MCP tool."""
+
+    def __init__(self, name, read_only=True, result=None):
+        self.name = name
+        self.metadata = {"readOnlyHint": read_only, "openWorldHint": False}
+        self.result = result
+        self.calls = 0
+
+
+def test_dumps_large_int():
+    assert loads(dumps({"n": 2**70})) == {"n": 2**70}
+    assert cache_key("add", {"a": 2**70}) == ("add", '{"a": %d}' % 2**70)
+
+
+def test_cache_evicts_least_recently_used():
+    cache = ToolResultCache(max_size=2)
+    cache.put(("a", "{}"), "1")
+    cache.put(("b", "{}"), "2")
+    assert cache.get(("a", "{}")) == "1"  # a becomes most recently used
+    cache.put(("c", "{}"), "3")
+    assert cache.get(("b", "{}")) is None
+    assert cache.get(("a", "{}")) == "1"
+    assert cache.get(("c", "{}")) == "3"
+    assert len(cache) == 2
+
+
+def test_cache_key_ignores_arg_order():
+    assert cache_key("add", {"a": 1, "b": 2}) == cache_key("add", {"b": 2, "a": 1})
+    assert cache_key("add", {"a": 1}) != cache_key("subtract", {"a": 1})
+
+
+# Tool metadata: (metadata, cacheable)
+@pytest.mark.parametrize("metadata,expected", [
+    ({"readOnlyHint": True, "openWorldHint": False}, True),
+    ({"readOnlyHint": True}, False),
+    ({"readOnlyHint": True, "openWorldHint": True}, False),
+    ({"readOnlyHint": False, "openWorldHint": False}, False),
+    (None, False),
+])
+def test_is_cacheable(metadata, expected):
+    tool = FakeTool("t")
+    tool.metadata = metadata
+    assert is_cacheable(tool) is expected
+
+
+def _dispatch(tool_calls, tools, cache):
+    async def invoke(tool, args):
+        tool.calls += 1
+        if isinstance(tool.result, BaseException):
+            raise tool.result
+        return tool.result
+
+    return asyncio.run(dispatch_tool_calls(tool_calls, tools, cache, invoke))
+
+
+def test_dispatch_dedupes_and_caches():
+    add = FakeTool("add", result=8.0)
+    cache = ToolResultCache()
+    calls = [
+        {"name": "add", "args": {"a": 5, "b": 3}},
+        {"name": "add", "args": {"b": 3, "a": 5}},
+    ]
+    assert _dispatch(calls, {"add": add}, cache) == ["8.0", "8.0"]
+    assert _dispatch(calls[:1], {"add": add}, cache) == ["8.0"]
+    assert add.calls == 1
+
+
+def test_dispatch_side_effect_clears_cache():
+    add = FakeTool("add", result=8.0)
+    save = FakeTool("save", read_only=False, result="ok")
+    cache = ToolResultCache()
+    _dispatch([{"name": "add", "args": {"a": 5}}], {"add": add}, cache)
+    _dispatch([{"name": "save", "args": {}}], {"save": save}, cache)
+    assert len(cache) == 0
+
+
+def test_dispatch_errors():
+    tools = {
+        "fail": FakeTool("fail", result=ValueError("boom")),
+        "cancelled": FakeTool("cancelled", result=asyncio.CancelledError()),
+    }
+    cache = ToolResultCache()
+    contents = _dispatch(
+        [{"name": "missing", "args": {}}, {"name": "fail", "args": {}}, {"name": "cancelled", "args": {}}],
+        tools,
+        cache,
+    )
+    assert [list(loads(c)) for c in contents] == [["error"]] * 3
+    assert len(cache) == 0
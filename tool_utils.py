@@ -0,0 +1,207 @@
+"""
+Tool Dispatch Utilities
+=======================
+
+Helpers shared by the Streamlit and CLI clients when invoking MCP tools.
+
+Serialization:
+--------------
+dumps()/loads() use orjson when it is installed (it ships with LangChain)
+and fall back to the standard json module otherwise.
+
+Result caching:
+---------------
+The LLM frequently repeats the same (tool, args) call within a session.
+ToolResultCache keeps serialized results of such calls in a small LRU so
+repeats are served without another round trip to the MCP server.
+
+Only tools that declare themselves side-effect free through MCP tool
+annotations (readOnlyHint=True, openWorldHint=False) are cached. Calling
+any other tool clears the cache, since it may change what the cached tools
+would return.
+
+Dispatch:
+---------
+dispatch_tool_calls() runs one LLM turn's tool calls concurrently, running
+identical cacheable calls once and serving repeats from a ToolResultCache.
+Each client supplies only how a single tool is invoked.
+"""
+
+import json
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Default number of tool results kept per cache
+MAX_CACHE_SIZE = 256
+
+
+if orjson is not None:
+    def dumps(obj: Any, sort_keys: bool = False) -> str:
+        """Serialize obj to JSON, using str() for unsupported types."""
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        try:
+            return orjson.dumps(obj, default=str, option=option).decode()
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, which the standard library handles
+            return json.dumps(obj, sort_keys=sort_keys, default=str)
+
+    loads = orjson.loads
+else:
+    def dumps(obj: Any, sort_keys: bool = False) -> str:
+        """Serialize obj to JSON, using str() for unsupported types."""
+        return json.dumps(obj, sort_keys=sort_keys, default=str)
+
+    loads = json.loads
+
+
+def cache_key(name: str, args: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    Build a cache key from a tool name and its arguments.
+
+    Args:
+        name: Tool name
+        args: Tool arguments
+
+    Returns:
+        Tuple of tool name and canonical (key-sorted) JSON arguments
+    """
+    return name, dumps(args, sort_keys=True)
+
+
+def is_cacheable(tool: Any) -> bool:
+    """
+    Check whether a tool's results may be cached.
+
+    Args:
+        tool: LangChain tool loaded from an MCP server
+
+    Returns:
+        True if the tool is annotated as read-only and closed-world
+    """
+    metadata = getattr(tool, "metadata", None) or {}
+    return bool(metadata.get("readOnlyHint")) and metadata.get("openWorldHint") is False
+
+
+class ToolResultCache:
+    """LRU cache of serialized tool results keyed by cache_key()."""
+
+    def __init__(self, max_size: int = MAX_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Tuple[str, str]) -> Optional[str]:
+        """Return the cached content for key, or None on a miss."""
+        content = self._entries.get(key)
+        if content is not None:
+            self._entries.move_to_end(key)
+        return content
+
+    def put(self, key: Tuple[str, str], content: str) -> None:
+        """Store content for key, evicting the least recently used entry if full."""
+        self._entries[key] = content
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
+
+
+async def dispatch_tool_calls(
+    tool_calls: List[Dict[str, Any]],
+    tools: Mapping[str, Any],
+    cache: ToolResultCache,
+    invoke: Callable[[Any, Dict[str, Any]], Awaitable[Any]],
+) -> List[str]:
+    """
+    Execute an LLM turn's tool calls concurrently.
+
+    Identical calls to cacheable tools run once and share their result;
+    repeats across turns are served from cache. Running any non-cacheable
+    tool clears the cache. Total latency is that of the slowest call.
+
+    Args:
+        tool_calls: Tool calls emitted by the LLM
+        tools: Mapping of tool name to tool
+        cache: Tool result cache to read and update
+        invoke: Returns an awaitable running a tool with the given args
+
+    Returns:
+        Serialized result per tool call, in the original order. Unknown tools
+        and failures are reported as {"error": ...} JSON.
+    """
+    contents = [None] * len(tool_calls)
+
+    # Group duplicate calls: (name, args) for cacheable tools, else the call index
+    groups = {}
+    for i, tc in enumerate(tool_calls):
+        name = tc["name"]
+        args = tc.get("args") or {}
+
+        if isinstance(args, str):
+            try:
+                args = loads(args)
+            except json.JSONDecodeError:
+                logger.warning(f"Failed to parse tool args as JSON: {args}")
+
+        tool = tools.get(name)
+        cacheable = tool is not None and is_cacheable(tool)
+        key = cache_key(name, args) if cacheable else i
+        group = groups.get(key)
+        if group is None:
+            groups[key] = (name, args, cacheable, [i])
+        else:
+            group[3].append(i)
+
+    pending = []
+    coros = []
+    for key, (name, args, cacheable, indices) in groups.items():
+        tool = tools.get(name)
+        if tool is None:
+            error_msg = f"Tool '{name}' not found"
+            logger.error(error_msg)
+            content = dumps({"error": error_msg})
+        else:
+            content = cache.get(key) if cacheable else None
+            if content is None:
+                logger.debug(f"Calling tool: {name} with args: {args}")
+                coros.append(invoke(tool, args))
+                pending.append((key, name, cacheable, indices))
+                continue
+            logger.debug(f"Tool {name} served from cache")
+        for i in indices:
+            contents[i] = content
+
+    results = await asyncio.gather(*coros, return_exceptions=True)
+
+    for (key, name, cacheable, indices), res in zip(pending, results):
+        if isinstance(res, BaseException):
+            error_msg = f"Error executing tool '{name}': {str(res)}"
+            logger.error(error_msg, exc_info=res)
+            content = dumps({"error": error_msg})
+        else:
+            logger.debug(f"Tool {name} executed successfully")
+            content = dumps(res)
+            if cacheable:
+                cache.put(key, content)
+        for i in indices:
+            contents[i] = content
+
+    # A non-cacheable tool may have side effects that stale cached results
+    if any(not cacheable for _, _, cacheable, _ in pending):
+        cache.clear()
+
+    return contents